@@ -0,0 +1,148 @@
+"""ASGI giriş noktası: uvicorn asgi:application
+
+Okuma ağırlıklı rotaların (index, quiz_detail, quiz_view, leaderboard) GET
+istekleri veritabanını aiomysql ile, event loop'u bloklamadan okur. Çekilen
+veri flask.g üzerinden normal Flask view'ına verilir, böylece session, flash,
+şablonlar ve hata sayfaları WSGI yoluyla aynı kalır. Geri kalan her şey
+Flask uygulamasına bir thread havuzu üzerinden aktarılır.
+"""
+import asyncio
+import io
+import os
+import sys
+
+import aiomysql
+from a2wsgi import WSGIMiddleware
+from flask import g, session
+from werkzeug.exceptions import HTTPException
+
+import queries
+from quiz import create_app, related_index
+
+ASYNC_LOADERS = {
+    "main.index": lambda cursor, user_id: queries.index_data_async(cursor),
+    "main.leaderboard": lambda cursor, user_id: queries.leaderboard_data_async(cursor),
+    "main.quiz_detail": lambda cursor, user_id, quiz_id: queries.quiz_detail_data_async(
+        cursor, quiz_id, user_id, related_index.get(quiz_id)),
+    "main.quiz_view": lambda cursor, user_id, quiz_id: queries.quiz_view_data_async(cursor, quiz_id, user_id),
+}
+
+
+def build_environ(scope, body=b""):
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode("utf8").decode("latin1"),
+        "PATH_INFO": scope["path"].encode("utf8").decode("latin1"),
+        "QUERY_STRING": scope["query_string"].decode("latin1"),
+        "SERVER_PROTOCOL": f"HTTP/{scope['http_version']}",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    server = scope.get("server") or ("localhost", 80)
+    environ["SERVER_NAME"], environ["SERVER_PORT"] = server[0], str(server[1])
+    if scope.get("client"):
+        environ["REMOTE_ADDR"] = scope["client"][0]
+
+    for name, value in scope["headers"]:
+        name = name.decode("latin1").upper().replace("-", "_")
+        value = value.decode("latin1")
+        if name not in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+            name = "HTTP_" + name
+        if name in environ:
+            # HTTP/2 cookie'leri ayrı başlıklar halinde gönderebilir; onlar "; " ile birleşir
+            ayirici = "; " if name == "HTTP_COOKIE" else ","
+            value = f"{environ[name]}{ayirici}{value}"
+        environ[name] = value
+    return environ
+
+
+class QuizASGI:
+    def __init__(self, flask_app):
+        self.app = flask_app
+        self.wsgi = WSGIMiddleware(flask_app, workers=flask_app.config["WSGI_THREADS"])
+        self.pool = None
+        self._pool_lock = asyncio.Lock()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            return await self.lifespan(receive, send)
+        if scope["type"] == "http" and scope["method"] == "GET":
+            if await self.handle_async(scope, send):
+                return
+        await self.wsgi(scope, receive, send)
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await self.get_pool()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if self.pool is not None:
+                    self.pool.close()
+                    await self.pool.wait_closed()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def get_pool(self):
+        async with self._pool_lock:
+            if self.pool is None:
+                config = self.app.config
+                self.pool = await aiomysql.create_pool(
+                    host=config["MYSQL_HOST"], user=config["MYSQL_USER"],
+                    password=config["MYSQL_PASSWORD"], db=config["MYSQL_DB"],
+                    maxsize=config["ASYNC_DB_POOL_SIZE"], autocommit=True,
+                    cursorclass=aiomysql.DictCursor, charset="utf8mb4")
+        return self.pool
+
+    async def handle_async(self, scope, send):
+        """İstek asenkron yoldan karşılandıysa True, WSGI'ye bırakılacaksa False döner."""
+        environ = build_environ(scope)
+        # Request context (session çözme vb.) sadece asenkron rotalar için kurulur;
+        # static dosyalar ve diğer rotalar doğrudan WSGI'ye gider
+        try:
+            endpoint, view_args = self.app.url_map.bind_to_environ(environ).match()
+        except HTTPException:
+            return False
+        if endpoint not in ASYNC_LOADERS:
+            return False
+
+        ctx = self.app.request_context(environ)
+        ctx.push()
+        error = None
+        try:
+            try:
+                pool = await self.get_pool()
+                async with pool.acquire() as conn:
+                    async with conn.cursor() as cursor:
+                        data = await ASYNC_LOADERS[endpoint](cursor, session.get("user_id"), **view_args)
+                if data is None:
+                    return False
+
+                g.prefetched = data
+                response = self.app.full_dispatch_request()
+            except Exception as e:
+                error = e
+                response = self.app.handle_exception(e)
+        finally:
+            ctx.pop(error)
+
+        await send({
+            "type": "http.response.start",
+            "status": response.status_code,
+            "headers": [(k.lower().encode("latin1"), v.encode("latin1")) for k, v in response.headers.items()],
+        })
+        await send({"type": "http.response.body", "body": response.get_data()})
+        response.close()
+        return True
+
+
+application = QuizASGI(create_app({
+    "ASYNC_DB_POOL_SIZE": int(os.environ.get("ASYNC_DB_POOL_SIZE", 10)),
+    "WSGI_THREADS": int(os.environ.get("WEB_THREADS", 8)),
+}))
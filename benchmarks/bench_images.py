@@ -0,0 +1,89 @@
+"""Resim işleme hattı için mikro benchmark.
+
+Eski (tam çözünürlükte decode + tam boyutta blur) ile şimdiki images.py
+hattını aynı girdiler üzerinde karşılaştırır: saniyedeki resim sayısı ve
+her hattın ayrı bir süreçte ulaştığı en yüksek bellek (ru_maxrss).
+
+Kullanım: python benchmarks/bench_images.py [--megapixel 24] [--tekrar 10]
+"""
+import argparse
+import io
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+from PIL import Image, ImageFilter, ImageOps
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import images  # noqa: E402
+
+
+def eski_hat(kaynak, target_size=(600, 600)):
+    """images.py'den önceki save_optimized_image gövdesi."""
+    img = Image.open(kaynak)
+    img = img.convert("RGB")
+    background = ImageOps.fit(img, target_size, method=Image.LANCZOS)
+    background = background.filter(ImageFilter.GaussianBlur(radius=20))
+    img.thumbnail(target_size, Image.LANCZOS)
+    bg_w, bg_h = target_size
+    img_w, img_h = img.size
+    background.paste(img, ((bg_w - img_w) // 2, (bg_h - img_h) // 2))
+    background.save(io.BytesIO(), format='JPEG', optimize=True, quality=90)
+
+
+def yeni_hat(kaynak, target_size=(600, 600)):
+    img = images.open_image(kaynak, target_size)
+    images.save_image(images.optimize_image(img, target_size), io.BytesIO())
+
+
+HATLAR = {"eski": eski_hat, "yeni": yeni_hat}
+
+
+def ornek_jpeg(megapiksel):
+    # 4:3 oranlı, gürültülü (iyi sıkışmayan) bir telefon fotoğrafı benzeri
+    w = int((megapiksel * 1_000_000 * 4 / 3) ** 0.5)
+    h = int(w * 3 / 4)
+    img = Image.effect_noise((w // 8, h // 8), 64).convert("RGB").resize((w, h), Image.BICUBIC)
+    buf = io.BytesIO()
+    img.save(buf, format="JPEG", quality=92)
+    return buf.getvalue(), (w, h)
+
+
+def _olc(ad, veri, tekrar, kuyruk):
+    hat = HATLAR[ad]
+    hat(io.BytesIO(veri))  # ısınma
+    basla = time.perf_counter()
+    for _ in range(tekrar):
+        hat(io.BytesIO(veri))
+    sure = time.perf_counter() - basla
+    kuyruk.put((ad, tekrar / sure, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--megapixel", type=float, default=24)
+    parser.add_argument("--tekrar", type=int, default=10)
+    args = parser.parse_args()
+
+    veri, (w, h) = ornek_jpeg(args.megapixel)
+    print(f"Girdi: {w}x{h} JPEG, {len(veri) / 1024:.0f} KB, {args.tekrar} tekrar")
+
+    # Her hat kendi sürecinde çalışır ki en yüksek bellek ölçümleri karışmasın
+    ctx = multiprocessing.get_context("spawn")
+    sonuclar = {}
+    for ad in HATLAR:
+        kuyruk = ctx.Queue()
+        surec = ctx.Process(target=_olc, args=(ad, veri, args.tekrar, kuyruk))
+        surec.start()
+        ad, hiz, maxrss = kuyruk.get()
+        surec.join()
+        sonuclar[ad] = (hiz, maxrss)
+        print(f"{ad:5s}: {hiz:6.2f} resim/sn, en yüksek bellek {maxrss / 1024:7.1f} MB")
+
+    print(f"Hızlanma: {sonuclar['yeni'][0] / sonuclar['eski'][0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""WSGI ve ASGI sunucularını aynı sayfalar üzerinde karşılaştırır.
+
+serve.py ile önce WSGI (gthread), sonra ASGI (uvicorn) sunucusunu ayağa
+kaldırır, her biri için sabit sürede eşzamanlı GET istekleri atar ve
+saniyedeki istek sayısı ile gecikme yüzdeliklerini yazdırır. Veritabanı
+ayarları (MYSQL_*) normal çalıştırmadaki gibi ortamdan okunur.
+
+Kullanım: python benchmarks/bench_server.py --yol / --yol /leaderboard --yol /quiz_detail/1
+"""
+import argparse
+import http.client
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _hazir_bekle(port, zaman_asimi=30):
+    bitis = time.time() + zaman_asimi
+    while time.time() < bitis:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Sunucu {port} portunda açılmadı")
+
+
+def _yuk_uret(port, yollar, saniye, eszamanli):
+    gecikmeler, hatalar = [], [0]
+    kilit = threading.Lock()
+    bitis = time.perf_counter() + saniye
+
+    def istemci(sira):
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+        i = sira
+        while time.perf_counter() < bitis:
+            yol = yollar[i % len(yollar)]
+            i += 1
+            basla = time.perf_counter()
+            try:
+                conn.request("GET", yol)
+                resp = conn.getresponse()
+                resp.read()
+                ok = resp.status < 500
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+                ok = False
+            with kilit:
+                if ok:
+                    gecikmeler.append(time.perf_counter() - basla)
+                else:
+                    hatalar[0] += 1
+        conn.close()
+
+    threadler = [threading.Thread(target=istemci, args=(n,)) for n in range(eszamanli)]
+    for t in threadler:
+        t.start()
+    for t in threadler:
+        t.join()
+    return gecikmeler, hatalar[0]
+
+
+def olc(mod, port, args):
+    env = dict(os.environ, PORT=str(port))
+    komut = [sys.executable, os.path.join(KOK, "serve.py")] + (["--asgi"] if mod == "asgi" else [])
+    sunucu = subprocess.Popen(komut, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        _hazir_bekle(port)
+        _yuk_uret(port, args.yol, 2, args.eszamanli)  # ısınma
+        gecikmeler, hatalar = _yuk_uret(port, args.yol, args.saniye, args.eszamanli)
+    finally:
+        sunucu.terminate()
+        sunucu.wait()
+
+    if not gecikmeler:
+        print(f"{mod:4s}: başarılı istek yok ({hatalar} hata)")
+        return 0.0
+    yuzdelik = statistics.quantiles(gecikmeler, n=100)
+    rps = len(gecikmeler) / args.saniye
+    print(f"{mod:4s}: {rps:8.1f} istek/sn  p50 {yuzdelik[49] * 1000:6.1f} ms  "
+          f"p99 {yuzdelik[98] * 1000:6.1f} ms  hata {hatalar}")
+    return rps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--yol", action="append", help="İstek atılacak yol (birden çok verilebilir)")
+    parser.add_argument("--saniye", type=float, default=15)
+    parser.add_argument("--eszamanli", type=int, default=64)
+    parser.add_argument("--port", type=int, default=5055)
+    args = parser.parse_args()
+    args.yol = args.yol or ["/", "/leaderboard"]
+
+    print(f"Yollar: {', '.join(args.yol)} | {args.eszamanli} eşzamanlı istemci, {args.saniye:g} sn")
+    wsgi = olc("wsgi", args.port, args)
+    asgi = olc("asgi", args.port, args)
+    if wsgi:
+        print(f"ASGI / WSGI: {asgi / wsgi:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
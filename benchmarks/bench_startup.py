@@ -0,0 +1,60 @@
+"""Worker açılış süresini ölçer.
+
+Her ölçüm temiz bir Python sürecinde yapılır:
+  fabrika : import quiz + create_app()  (ağır modüller ertelenmiş)
+  eski    : aynısı + PIL, passlib ve WTForms'un baştan yüklenmesi
+            (create_app öncesindeki, her şeyin import anında yüklendiği düzen)
+Ayrıca ertelenen her modülün tek başına import süresini yazdırır.
+
+Kullanım: python benchmarks/bench_startup.py [--tekrar 15]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ERTELENENLER = ["PIL.Image, PIL.ImageFilter, PIL.ImageOps", "passlib.hash", "wtforms"]
+
+OLCUM = """
+import time
+t = time.perf_counter()
+{on_import}
+import quiz
+quiz.create_app()
+print((time.perf_counter() - t) * 1000)
+"""
+
+
+def _sure(kod):
+    cikti = subprocess.run([sys.executable, "-c", kod], cwd=KOK, check=True,
+                           capture_output=True, text=True).stdout
+    return float(cikti.strip().splitlines()[-1])
+
+
+def _medyan(kod, tekrar):
+    return statistics.median(_sure(kod) for _ in range(tekrar))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tekrar", type=int, default=15)
+    args = parser.parse_args()
+
+    fabrika = _medyan(OLCUM.format(on_import=""), args.tekrar)
+    eski = _medyan(OLCUM.format(on_import="\n".join(f"import {m}" for m in ERTELENENLER)), args.tekrar)
+
+    print(f"fabrika : {fabrika:7.1f} ms")
+    print(f"eski    : {eski:7.1f} ms")
+    print(f"Kazanç  : {eski - fabrika:7.1f} ms ({(1 - fabrika / eski) * 100:.0f}%)")
+
+    print("\nErtelenen modüller (tek başına):")
+    for modul in ERTELENENLER:
+        kod = f"import time\nt = time.perf_counter()\nimport {modul}\nprint((time.perf_counter() - t) * 1000)"
+        print(f"  {modul:38s} {_medyan(kod, args.tekrar):6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+from wtforms import Form, StringField, TextAreaField, PasswordField, validators, RadioField, FileField, SelectField
+from wtforms.validators import InputRequired, Optional
+
+class RegisterForm(Form):
+    name = StringField("İsim Soyisim", validators=[validators.Length(min=4, max=20), validators.DataRequired()])
+    username = StringField("Kullanıcı Adı", validators=[validators.Length(min=5, max=30)])
+    email = StringField("E Mail", validators=[validators.Email(message="Lütfen geçerli bir email adresi giriniz...")])
+    password = PasswordField("Parola:", validators=[
+        validators.DataRequired(message="Lütfen bir parola belirleyiniz."),
+        validators.EqualTo(fieldname="confirm", message="Parolanız Uyuşmuyor.")
+    ])
+    confirm = PasswordField("Parola Doğrula")
+
+class LoginForm(Form):
+    username = StringField("", render_kw={"placeholder": "Kullanıcı Adı veya Email "})
+    password = PasswordField("", render_kw={"placeholder": "Şifre"})
+
+class QuizCreateForm(Form):
+    title = StringField("Quiz Başlığı", validators=[validators.Length(min=5, max=255), validators.DataRequired(message="Lütfen bir başlık girin")])
+    description = TextAreaField("Açıklama", validators=[validators.DataRequired(message="Lütfen bir açıklama girin")])
+    category = SelectField("Kategori", choices=[
+        ('Genel', '🌍 Genel'), ('Oyun', '🎮 Oyun'), ('Müzik', '🎵 Müzik'),
+        ('Film', '🎬 Film & Dizi'), ('Spor', '⚽ Spor'), ('Anime', '🎌 Anime'),
+        ('Eğlence', '🎉 Eğlence'), ('Teknoloji', '💻 Teknoloji'), ('Bilim', '🧪 Bilim'),
+        ('Tarih', '📜 Tarih'), ('Yemek', '🍔 Yemek'), ('Doğa', '🌲 Doğa'),
+        ('Sanat', '🎨 Sanat'), ('Eğitim', '📚 Eğitim'), ('Yaşam', '🧘 Yaşam'),
+        ('Yayıncı', '📹 Yayıncılar')
+    ])
+    cover_image = FileField('Kapak Fotoğrafı (Opsiyonel)', validators=[Optional()]) 
+    quiz_type = RadioField("Quiz Tipi", 
+                           choices=[('klasik_test', 'Klasik Test (Sonuç Odaklı)'),
+                                    ('turnuva', 'Turnuva (VS, Fotoğraflı Eleme)')],
+                           default='klasik_test',
+                           validators=[validators.DataRequired(message="Lütfen bir quiz tipi seçin")])
+
+class QuestionAddForm(Form):
+    question_text = TextAreaField("Soru Metni", validators=[validators.DataRequired(message="Soru alanı boş bırakılamaz")])
+    option_a = StringField("A Seçeneği", validators=[validators.DataRequired()])
+    option_b = StringField("B Seçeneği", validators=[validators.DataRequired()])
+    option_c = StringField("C Seçeneği", validators=[validators.DataRequired()])
+    option_d = StringField("D Seçeneği", validators=[validators.DataRequired()])
+
+class PollItemForm(Form):
+    item_name = StringField("Seçenek Adı (Opsiyonel)") 
+    item_image = FileField('Seçenek Fotoğrafı', validators=[InputRequired(message="Lütfen bir fotoğraf seçin")])
+
+class ProfileEditForm(Form):
+    profile_image = FileField('Yeni Profil Fotoğrafı', validators=[InputRequired(message="Lütfen bir fotoğraf seçin")])
@@ -0,0 +1,5 @@
+# Resim hedef boyutları. PIL import etmez; açılışta yüklenen modüller
+# (ör. reencode_uploads) images.py'yi yüklemeden kullanabilsin diye ayrı.
+
+VARSAYILAN_BOYUT = (600, 600)
+PROFIL_BOYUTU = (400, 400)
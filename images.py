@@ -0,0 +1,89 @@
+import os
+
+from PIL import Image, ImageFilter, ImageOps
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from image_sizes import PROFIL_BOYUTU, VARSAYILAN_BOYUT
+
+ARKA_PLAN_OLCEK = 4
+
+# ~50 MP üstü resimler reddedilir (decompression bomb koruması)
+MAKS_PIKSEL = 50_000_000
+Image.MAX_IMAGE_PIXELS = MAKS_PIKSEL
+
+
+class ImageTooLarge(RequestEntityTooLarge):
+    """413 olarak ele alınır, yani MAX_CONTENT_LENGTH aşımıyla aynı hata sayfasına düşer."""
+
+
+def _piksel_kontrol(img):
+    if img.width * img.height > MAKS_PIKSEL:
+        raise ImageTooLarge(f"{img.width}x{img.height} piksel sınırı aşıyor")
+
+
+def check_image(file_storage):
+    """Sadece başlığı okuyarak piksel sınırını kontrol eder; birden çok dosyalı
+    formlarda hiçbiri kaydedilmeden önce hepsini doğrulamak için."""
+    try:
+        with Image.open(file_storage) as img:
+            _piksel_kontrol(img)
+    except Image.DecompressionBombError as e:
+        raise ImageTooLarge(str(e)) from e
+    except ImageTooLarge:
+        raise
+    except Exception:
+        pass  # Açılamayan dosyalar save_optimized_image'da ham olarak kaydedilir
+    finally:
+        file_storage.seek(0)
+
+
+def open_image(kaynak, target_size):
+    """Resmi açar, boyutunu kontrol eder ve JPEG'leri küçültülmüş çözünürlükte decode eder."""
+    img = Image.open(kaynak)
+    _piksel_kontrol(img)
+
+    # JPEG'ler hedef boyuttan küçük olmayacak en düşük ölçekte (1/2, 1/4, 1/8) decode edilir
+    img.draft("RGB", target_size)
+    return img
+
+
+def optimize_image(img, target_size=VARSAYILAN_BOYUT):
+    """Resmi bulanık arka planlı, ortalanmış bir kareye dönüştürür."""
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+
+    # 1. Ön Plan (Orantılı)
+    img.thumbnail(target_size, Image.LANCZOS)
+
+    # 2. Arka Plan (Bulanık Efekt) - ön plandan, çeyrek boyutta üretilir;
+    # nasılsa bulanıklaşacağı için tam çözünürlükte hesaplamaya gerek yok
+    bg_w, bg_h = target_size
+    kucuk = (max(1, bg_w // ARKA_PLAN_OLCEK), max(1, bg_h // ARKA_PLAN_OLCEK))
+    background = ImageOps.fit(img, kucuk, method=Image.BILINEAR)
+    background = background.filter(ImageFilter.GaussianBlur(radius=20 / ARKA_PLAN_OLCEK))
+    background = background.resize(target_size, Image.BICUBIC)
+
+    # 3. Birleştirme
+    img_w, img_h = img.size
+    offset = ((bg_w - img_w) // 2, (bg_h - img_h) // 2)
+    background.paste(img, offset)
+    return background
+
+
+def save_image(img, save_path):
+    img.save(save_path, format='JPEG', optimize=True, quality=90)
+
+
+def save_optimized_image(file_storage, save_path, target_size=VARSAYILAN_BOYUT):
+    """Resimleri optimize ederek ve kırparak kaydeder."""
+    os.makedirs(os.path.dirname(save_path), exist_ok=True)
+    try:
+        img = open_image(file_storage, target_size)
+        save_image(optimize_image(img, target_size), save_path)
+
+    except (ImageTooLarge, Image.DecompressionBombError) as e:
+        raise ImageTooLarge(str(e)) from e
+    except Exception as e:
+        print(f"Resim işleme hatası: {e}")
+        file_storage.seek(0)
+        file_storage.save(save_path)
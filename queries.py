@@ -0,0 +1,119 @@
+"""Okuma ağırlıklı rotaların sorguları.
+
+Her sorgunun senkron (flask_mysqldb) ve asenkron (aiomysql) bir sürümü var;
+ikisi de aynı SQL'i çalıştırır ve şablona verilecek sözlüğü döndürür.
+"""
+
+INDEX_SQL = "SELECT q.*, u.name as author_name FROM quizzes q JOIN users u ON q.user_id = u.id ORDER BY q.created_at DESC"
+
+LEADERBOARD_SQL = """
+    SELECT users.id, users.username, users.name, users.profile_pic_url,
+        COALESCE(SUM(quizzes.views), 0) as total_views,
+        COALESCE(SUM(quizzes.likes), 0) as total_likes
+    FROM users LEFT JOIN quizzes ON users.id = quizzes.user_id
+    GROUP BY users.id ORDER BY total_views DESC LIMIT 20
+"""
+
+QUIZ_DETAIL_SQL = "SELECT q.*, u.username, u.profile_pic_url FROM quizzes q JOIN users u ON q.user_id = u.id WHERE q.quiz_id = %s"
+QUESTION_COUNT_SQL = "SELECT COUNT(*) as count FROM questions WHERE quiz_id = %s"
+IS_LIKED_SQL = "SELECT * FROM quiz_likes WHERE user_id=%s AND quiz_id=%s"
+IS_SAVED_SQL = "SELECT * FROM quiz_saves WHERE user_id=%s AND quiz_id=%s"
+RELATED_SQL = "SELECT q.*, u.name as author_name FROM quizzes q JOIN users u ON q.user_id = u.id WHERE q.quiz_id IN ({})"
+
+QUIZ_SQL = "SELECT * FROM quizzes WHERE quiz_id = %s"
+QUESTIONS_SQL = "SELECT * FROM questions WHERE quiz_id = %s"
+VIEWS_SQL = "UPDATE quizzes SET views = views + 1 WHERE quiz_id = %s"
+
+
+def _related_sql(related_ids):
+    return RELATED_SQL.format(", ".join(["%s"] * len(related_ids)))
+
+
+def _related_sirala(related_ids, rows):
+    # IN (...) sırayı korumaz; index'teki benzerlik sırasına geri dizilir
+    satirlar = {row["quiz_id"]: row for row in rows}
+    return [satirlar[i] for i in related_ids if i in satirlar]
+
+
+# === SENKRON ===
+
+def index_data(cursor):
+    result = cursor.execute(INDEX_SQL)
+    return {"quizzes": cursor.fetchall() if result > 0 else None}
+
+
+def leaderboard_data(cursor):
+    cursor.execute(LEADERBOARD_SQL)
+    return {"users": cursor.fetchall()}
+
+
+def quiz_detail_data(cursor, quiz_id, user_id=None, related_ids=()):
+    cursor.execute(QUIZ_DETAIL_SQL, (quiz_id,))
+    quiz = cursor.fetchone()
+    if not quiz:
+        return {"quiz": None}
+
+    cursor.execute(QUESTION_COUNT_SQL, (quiz_id,))
+    data = {"quiz": quiz, "q_count": cursor.fetchone()['count'], "is_liked": False, "is_saved": False}
+
+    if user_id is not None:
+        cursor.execute(IS_LIKED_SQL, (user_id, quiz_id))
+        data["is_liked"] = bool(cursor.fetchone())
+        cursor.execute(IS_SAVED_SQL, (user_id, quiz_id))
+        data["is_saved"] = bool(cursor.fetchone())
+
+    data["related"] = []
+    if related_ids:
+        cursor.execute(_related_sql(related_ids), tuple(related_ids))
+        data["related"] = _related_sirala(related_ids, cursor.fetchall())
+    return data
+
+
+# === ASENKRON ===
+
+async def index_data_async(cursor):
+    result = await cursor.execute(INDEX_SQL)
+    return {"quizzes": await cursor.fetchall() if result > 0 else None}
+
+
+async def leaderboard_data_async(cursor):
+    await cursor.execute(LEADERBOARD_SQL)
+    return {"users": await cursor.fetchall()}
+
+
+async def quiz_detail_data_async(cursor, quiz_id, user_id=None, related_ids=()):
+    await cursor.execute(QUIZ_DETAIL_SQL, (quiz_id,))
+    quiz = await cursor.fetchone()
+    if not quiz:
+        return {"quiz": None}
+
+    await cursor.execute(QUESTION_COUNT_SQL, (quiz_id,))
+    data = {"quiz": quiz, "q_count": (await cursor.fetchone())['count'], "is_liked": False, "is_saved": False}
+
+    if user_id is not None:
+        await cursor.execute(IS_LIKED_SQL, (user_id, quiz_id))
+        data["is_liked"] = bool(await cursor.fetchone())
+        await cursor.execute(IS_SAVED_SQL, (user_id, quiz_id))
+        data["is_saved"] = bool(await cursor.fetchone())
+
+    data["related"] = []
+    if related_ids:
+        await cursor.execute(_related_sql(related_ids), tuple(related_ids))
+        data["related"] = _related_sirala(related_ids, await cursor.fetchall())
+    return data
+
+
+async def quiz_view_data_async(cursor, quiz_id, user_id=None):
+    """Sadece klasik testin GET'i; turnuva oturum durumuna bağlı olduğu için WSGI tarafında kalır."""
+    await cursor.execute(QUIZ_SQL, (quiz_id,))
+    quiz = await cursor.fetchone()
+    if not quiz or quiz["quiz_type"] != 'klasik_test':
+        return None
+
+    await cursor.execute(QUESTIONS_SQL, (quiz_id,))
+    questions = await cursor.fetchall()
+    try:
+        await cursor.execute(VIEWS_SQL, (quiz_id,))  # havuz autocommit modunda
+    except Exception:
+        pass
+    return {"quiz": quiz, "questions": questions}
@@ -1,45 +1,86 @@
+import time
+_IMPORT_BASLANGIC = time.perf_counter()
+
 import os
 import uuid
 import random
 from functools import wraps
 from werkzeug.utils import secure_filename
-from PIL import Image, ImageFilter, ImageOps
-from flask import Flask, render_template, flash, redirect, url_for, session, request
+from flask import Flask, Blueprint, current_app, render_template, flash, redirect, url_for, session, request, g
 from flask_mysqldb import MySQL
-from wtforms import Form, StringField, TextAreaField, PasswordField, validators, RadioField, FileField, SelectField
-from wtforms.validators import InputRequired, Optional
-from passlib.hash import sha256_crypt
+from markupsafe import Markup
+from fragment_cache import FragmentCache
+from static_assets import StaticAssets
+from reencode_uploads import register_commands
+from recommendations import RelatedIndex
+import queries
 
-# === UYGULAMA AYARLARI (CONFIG) ===
-app = Flask(__name__)
+# PIL (images), passlib ve WTForms (forms) ağır modüller; worker'ların hızlı
+# ayağa kalkması için sadece onları kullanan rotaların içinde import edilir.
 
-app.secret_key = os.environ.get("SECRET_KEY", "varsayilan_cok_guclu_bir_anahtar_olmali")
+mysql = MySQL()
+static_assets = StaticAssets()
+related_index = RelatedIndex(mysql)
+bp = Blueprint("main", __name__)
 
-# MySQL Bağlantı Ayarları
-app.config["MYSQL_HOST"] = os.environ.get("MYSQL_HOST", "localhost")
-app.config["MYSQL_USER"] = os.environ.get("MYSQL_USER", "root")
-app.config["MYSQL_PASSWORD"] = os.environ.get("MYSQL_PASSWORD", "")
-app.config["MYSQL_DB"] = os.environ.get("MYSQL_DB", "quizes")
-app.config["MYSQL_CURSORCLASS"] = "DictCursor"
+# === UYGULAMA AYARLARI (CONFIG) ===
 
-# Dosya Yükleme Ayarları
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif'}
-base_dir = app.root_path
-
-UPLOAD_FOLDER = os.path.join(base_dir, 'static/uploads/quiz_images')
-UPLOAD_FOLDER_PROFILE = os.path.join(base_dir, 'static/uploads/profile_pics')
-UPLOAD_FOLDER_QUIZ_COVERS = os.path.join(base_dir, 'static/uploads/quiz_covers')
 
-app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
-app.config['UPLOAD_FOLDER_PROFILE'] = UPLOAD_FOLDER_PROFILE
-app.config['UPLOAD_FOLDER_QUIZ_COVERS'] = UPLOAD_FOLDER_QUIZ_COVERS
-
-# Klasör Kontrolü
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
-os.makedirs(app.config['UPLOAD_FOLDER_PROFILE'], exist_ok=True)
-os.makedirs(app.config['UPLOAD_FOLDER_QUIZ_COVERS'], exist_ok=True)
-
-mysql = MySQL(app)
+def create_app(config=None):
+    """Uygulamayı oluşturur ve açılış adımlarının sürelerini STARTUP_TIMINGS'e yazar."""
+    sureler = {}
+    adim_baslangic = time.perf_counter()
+
+    def adim(ad):
+        nonlocal adim_baslangic
+        simdi = time.perf_counter()
+        sureler[ad] = round((simdi - adim_baslangic) * 1000, 1)
+        adim_baslangic = simdi
+
+    app = Flask(__name__)
+    app.secret_key = os.environ.get("SECRET_KEY", "varsayilan_cok_guclu_bir_anahtar_olmali")
+
+    # MySQL Bağlantı Ayarları
+    app.config["MYSQL_HOST"] = os.environ.get("MYSQL_HOST", "localhost")
+    app.config["MYSQL_USER"] = os.environ.get("MYSQL_USER", "root")
+    app.config["MYSQL_PASSWORD"] = os.environ.get("MYSQL_PASSWORD", "")
+    app.config["MYSQL_DB"] = os.environ.get("MYSQL_DB", "quizes")
+    app.config["MYSQL_CURSORCLASS"] = "DictCursor"
+
+    # Dosya Yükleme Ayarları (klasörler ilk kayıtta oluşturulur)
+    # En kalabalık form add_results: 4 resim x 16 MB (+ metin alanları). Resim başına
+    # asıl sınır images.MAKS_PIKSEL; bu sadece aşırı büyük istekleri okumadan reddeder.
+    app.config['MAX_CONTENT_LENGTH'] = 65 * 1024 * 1024
+    app.config['UPLOAD_FOLDER'] = os.path.join(app.root_path, 'static/uploads/quiz_images')
+    app.config['UPLOAD_FOLDER_PROFILE'] = os.path.join(app.root_path, 'static/uploads/profile_pics')
+    app.config['UPLOAD_FOLDER_QUIZ_COVERS'] = os.path.join(app.root_path, 'static/uploads/quiz_covers')
+
+    # Nginx/Apache önündeyse dosyaları X-Sendfile ile sunucuya bırak
+    app.config["USE_X_SENDFILE"] = os.environ.get("USE_X_SENDFILE", "False").lower() == "true"
+
+    # Quiz kartı önbelleği (liste sayfaları için render edilmiş HTML parçaları)
+    app.config["CARD_CACHE_SIZE"] = int(os.environ.get("CARD_CACHE_SIZE", 2048))
+
+    if config:
+        app.config.update(config)
+    adim("config")
+
+    mysql.init_app(app)
+    static_assets.init_app(app)
+    related_index.init_app(app)
+    register_commands(app, mysql)
+    app.extensions["card_cache"] = FragmentCache(maxsize=app.config["CARD_CACHE_SIZE"])
+    adim("eklentiler")
+
+    app.register_blueprint(bp)
+    adim("rotalar")
+
+    sureler["import"] = round(IMPORT_SURESI * 1000, 1)
+    sureler["toplam"] = round(sum(sureler.values()), 1)
+    app.config["STARTUP_TIMINGS"] = sureler
+    app.logger.info("Uygulama hazır (ms): %s", sureler)
+    return app
 
 # === YARDIMCI FONKSİYONLAR ===
 
@@ -47,31 +88,42 @@ def allowed_file(filename):
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def save_optimized_image(file_storage, save_path, target_size=(600, 600)):
-    """Resimleri optimize ederek ve kırparak kaydeder."""
+# Kartta görünen alanlar; biri değişince kartın sürümü de değişir
+KART_ALANLARI = ("title", "description", "cover_image_url", "category", "quiz_type",
+                 "username", "author_name")
+
+# Her görüntülenmede değişen sayaçlar önbelleğe girmez; kart yer tutucularla
+# render edilir, gerçek değerler her istekte yerine yazılır
+SAYAC_ALANLARI = ("views", "likes")
+
+def _yer_tutucu(alan):
+    return f"\x00{alan}\x00"
+
+@bp.app_template_global()
+def quiz_card(quiz, variant):
+    """Quiz kartını önbellekten döndürür, yoksa render edip önbelleğe koyar."""
+    version = tuple(quiz.get(alan) for alan in KART_ALANLARI)
+    key = (variant, quiz["quiz_id"], version)
+
+    def render():
+        template = current_app.jinja_env.get_template(f"includes/_quiz_card_{variant}.html")
+        sablon_quiz = dict(quiz, **{alan: Markup(_yer_tutucu(alan)) for alan in SAYAC_ALANLARI})
+        return Markup(template.render(quiz=sablon_quiz))
+
+    kart = current_app.extensions["card_cache"].get_or_render(key, render)
+    for alan in SAYAC_ALANLARI:
+        kart = kart.replace(_yer_tutucu(alan), str(quiz.get(alan)))
+    return kart
+
+def oku(loader, *args):
+    """Rota verisini ASGI tarafı (asgi.py) önceden çektiyse onu, yoksa MySQL'den okur."""
+    if "prefetched" in g:
+        return g.pop("prefetched")
+    cursor = mysql.connection.cursor()
     try:
-        img = Image.open(file_storage)
-        img = img.convert("RGB")
-        
-        # 1. Arka Plan (Bulanık Efekt)
-        background = ImageOps.fit(img, target_size, method=Image.LANCZOS)
-        background = background.filter(ImageFilter.GaussianBlur(radius=20))
-        
-        # 2. Ön Plan (Orantılı)
-        img.thumbnail(target_size, Image.LANCZOS)
-        
-        # 3. Birleştirme
-        bg_w, bg_h = target_size
-        img_w, img_h = img.size
-        offset = ((bg_w - img_w) // 2, (bg_h - img_h) // 2)
-        background.paste(img, offset)
-        
-        background.save(save_path, format='JPEG', optimize=True, quality=90)
-        
-    except Exception as e:
-        print(f"Resim işleme hatası: {e}")
-        file_storage.seek(0)
-        file_storage.save(save_path)
+        return loader(cursor, *args)
+    finally:
+        cursor.close()
 
 YASAKLI_KELIMELER = ["aptal", "salak", "küfür1", "küfür2", "+18kelime"]
 
@@ -91,7 +143,7 @@ def login_required(f):
     def decorated_function(*args, **kwargs):
         if "logged_in" not in session:
             flash("Bu sayfayı görüntülemek için lütfen giriş yapın.", "danger")
-            return redirect(url_for("login"))
+            return redirect(url_for("main.login"))
         return f(*args, **kwargs)
     return decorated_function
 
@@ -100,80 +152,29 @@ def admin_required(f):
     def decorated_function(*args, **kwargs):
         if "logged_in" not in session or not session.get("is_admin"):
             flash("Bu sayfaya erişim yetkiniz yok!", "danger")
-            return redirect(url_for("index"))
+            return redirect(url_for("main.index"))
         return f(*args, **kwargs)
     return decorated_function
 
-# === FORM SINIFLARI ===
-
-class RegisterForm(Form):
-    name = StringField("İsim Soyisim", validators=[validators.Length(min=4, max=20), validators.DataRequired()])
-    username = StringField("Kullanıcı Adı", validators=[validators.Length(min=5, max=30)])
-    email = StringField("E Mail", validators=[validators.Email(message="Lütfen geçerli bir email adresi giriniz...")])
-    password = PasswordField("Parola:", validators=[
-        validators.DataRequired(message="Lütfen bir parola belirleyiniz."),
-        validators.EqualTo(fieldname="confirm", message="Parolanız Uyuşmuyor.")
-    ])
-    confirm = PasswordField("Parola Doğrula")
-
-class LoginForm(Form):
-    username = StringField("", render_kw={"placeholder": "Kullanıcı Adı veya Email "})
-    password = PasswordField("", render_kw={"placeholder": "Şifre"})
-
-class QuizCreateForm(Form):
-    title = StringField("Quiz Başlığı", validators=[validators.Length(min=5, max=255), validators.DataRequired(message="Lütfen bir başlık girin")])
-    description = TextAreaField("Açıklama", validators=[validators.DataRequired(message="Lütfen bir açıklama girin")])
-    category = SelectField("Kategori", choices=[
-        ('Genel', '🌍 Genel'), ('Oyun', '🎮 Oyun'), ('Müzik', '🎵 Müzik'),
-        ('Film', '🎬 Film & Dizi'), ('Spor', '⚽ Spor'), ('Anime', '🎌 Anime'),
-        ('Eğlence', '🎉 Eğlence'), ('Teknoloji', '💻 Teknoloji'), ('Bilim', '🧪 Bilim'),
-        ('Tarih', '📜 Tarih'), ('Yemek', '🍔 Yemek'), ('Doğa', '🌲 Doğa'),
-        ('Sanat', '🎨 Sanat'), ('Eğitim', '📚 Eğitim'), ('Yaşam', '🧘 Yaşam'),
-        ('Yayıncı', '📹 Yayıncılar')
-    ])
-    cover_image = FileField('Kapak Fotoğrafı (Opsiyonel)', validators=[Optional()]) 
-    quiz_type = RadioField("Quiz Tipi", 
-                           choices=[('klasik_test', 'Klasik Test (Sonuç Odaklı)'),
-                                    ('turnuva', 'Turnuva (VS, Fotoğraflı Eleme)')],
-                           default='klasik_test',
-                           validators=[validators.DataRequired(message="Lütfen bir quiz tipi seçin")])
-
-class QuestionAddForm(Form):
-    question_text = TextAreaField("Soru Metni", validators=[validators.DataRequired(message="Soru alanı boş bırakılamaz")])
-    option_a = StringField("A Seçeneği", validators=[validators.DataRequired()])
-    option_b = StringField("B Seçeneği", validators=[validators.DataRequired()])
-    option_c = StringField("C Seçeneği", validators=[validators.DataRequired()])
-    option_d = StringField("D Seçeneği", validators=[validators.DataRequired()])
-
-class PollItemForm(Form):
-    item_name = StringField("Seçenek Adı (Opsiyonel)") 
-    item_image = FileField('Seçenek Fotoğrafı', validators=[InputRequired(message="Lütfen bir fotoğraf seçin")])
-
-class ProfileEditForm(Form):
-    profile_image = FileField('Yeni Profil Fotoğrafı', validators=[InputRequired(message="Lütfen bir fotoğraf seçin")])
-
 # === ROTALAR (ROUTES) ===
 
-@app.route("/")
+@bp.route("/")
 def index():
-    cursor = mysql.connection.cursor()
-    sorgu = "SELECT q.*, u.name as author_name FROM quizzes q JOIN users u ON q.user_id = u.id ORDER BY q.created_at DESC"
-    result = cursor.execute(sorgu)
-    quizzes = cursor.fetchall() if result > 0 else None
-    cursor.close()
-    return render_template("index.html", quizzes=quizzes)
+    return render_template("index.html", **oku(queries.index_data))
 
-@app.route("/about")
+@bp.route("/about")
 def about():
     return render_template("about.html")
 
-@app.route("/logout")
+@bp.route("/logout")
 def logout():
     session.clear()
-    return redirect(url_for("index"))
+    return redirect(url_for("main.index"))
 
-@app.route("/register", methods=["GET", "POST"])
+@bp.route("/register", methods=["GET", "POST"])
 def register():
+    from forms import RegisterForm
+    from passlib.hash import sha256_crypt
     form = RegisterForm(request.form)
     if request.method == "POST" and form.validate():
         name = form.name.data
@@ -188,7 +189,7 @@ def register():
         if result > 0:
             flash("Bu e-posta adresi veya kullanıcı adı zaten alınmış!", "danger")
             cursor.close()
-            return redirect(url_for("register"))
+            return redirect(url_for("main.register"))
         else:
             default_profile_pic = "default.png" 
             sorgu_kayit = "INSERT INTO users(name,email,username,password,profile_pic_url) VALUES(%s,%s,%s,%s,%s)"
@@ -196,11 +197,13 @@ def register():
             mysql.connection.commit()
             cursor.close()
             flash("Başarıyla kayıt oldunuz. Şimdi giriş yapabilirsiniz.", "success")
-            return redirect(url_for("login"))
+            return redirect(url_for("main.login"))
     return render_template("register.html", form=form)
 
-@app.route("/login", methods=["GET", "POST"])
+@bp.route("/login", methods=["GET", "POST"])
 def login():
+    from forms import LoginForm
+    from passlib.hash import sha256_crypt
     form = LoginForm(request.form)
     if request.method == "POST":
         username_or_email = form.username.data 
@@ -219,20 +222,22 @@ def login():
                 session["user_id"] = data["id"]
                 session["profile_pic_url"] = data["profile_pic_url"]
                 session["is_admin"] = (data["is_admin"] == 1)
-                return redirect(url_for("index"))
+                return redirect(url_for("main.index"))
             else:
                 flash("Parolanızı Yanlış Girdiniz", "danger")
-                return redirect(url_for("login"))
+                return redirect(url_for("main.login"))
         else:
             flash("Kullanıcı adı veya e-posta bulunamadı.", "danger")
-            return redirect(url_for("login"))
+            return redirect(url_for("main.login"))
     return render_template("login.html", form=form)
 
 # === QUIZ OLUŞTURMA İŞLEMLERİ ===
 
-@app.route("/create_quiz", methods=["GET", "POST"])
+@bp.route("/create_quiz", methods=["GET", "POST"])
 @login_required 
 def create_quiz():
+    from forms import QuizCreateForm
+    from images import save_optimized_image
     form = QuizCreateForm(request.form)
     if request.method == "POST" and form.validate():
         title = form.title.data
@@ -251,7 +256,7 @@ def create_quiz():
         if file and file.filename != '' and allowed_file(file.filename):
             filename = secure_filename(file.filename)
             unique_filename = str(uuid.uuid4()) + "_" + filename 
-            file_path = os.path.join(app.config['UPLOAD_FOLDER_QUIZ_COVERS'], unique_filename)
+            file_path = os.path.join(current_app.config['UPLOAD_FOLDER_QUIZ_COVERS'], unique_filename)
             save_optimized_image(file, file_path)
             cover_image_filename = unique_filename
         
@@ -263,10 +268,10 @@ def create_quiz():
         cursor.close()
         
         flash("Quiz başarıyla oluşturuldu! Şimdi soruları ekleyebilirsiniz.", "success")
-        return redirect(url_for("add_questions", quiz_id=quiz_id))
+        return redirect(url_for("main.add_questions", quiz_id=quiz_id))
     return render_template("create_quiz.html", form=form)
 
-@app.route("/add_questions/<string:quiz_id>", methods=["GET", "POST"])
+@bp.route("/add_questions/<string:quiz_id>", methods=["GET", "POST"])
 @login_required 
 def add_questions(quiz_id):
     cursor = mysql.connection.cursor()
@@ -276,13 +281,14 @@ def add_questions(quiz_id):
     if result == 0:
         flash("Quiz bulunamadı.", "danger")
         cursor.close()
-        return redirect(url_for("index"))
+        return redirect(url_for("main.index"))
         
     quiz_data = cursor.fetchone()
     quiz_type = quiz_data["quiz_type"]
     quiz_title = quiz_data["title"] 
 
     if quiz_type == 'klasik_test':
+        from forms import QuestionAddForm
         form = QuestionAddForm(request.form) 
         if request.method == "POST" and form.validate():
             question_text = form.question_text.data
@@ -295,14 +301,14 @@ def add_questions(quiz_id):
 
             if not correct_answer:
                  flash("Lütfen doğru cevabı işaretleyin.", "danger")
-                 return redirect(url_for("add_questions", quiz_id=quiz_id))
+                 return redirect(url_for("main.add_questions", quiz_id=quiz_id))
 
             sorgu_ekle = "INSERT INTO questions (quiz_id, question_text, option_a, option_b, option_c, option_d, correct_answer) VALUES (%s, %s, %s, %s, %s, %s, %s)"
             cursor.execute(sorgu_ekle, (quiz_id, question_text, option_a, option_b, option_c, option_d, correct_answer))
             mysql.connection.commit()
             
             flash("Soru başarıyla eklendi.", "success")
-            return redirect(url_for("add_questions", quiz_id=quiz_id))
+            return redirect(url_for("main.add_questions", quiz_id=quiz_id))
 
         sorgu_sorular = "SELECT * FROM questions WHERE quiz_id = %s ORDER BY question_id ASC"
         cursor.execute(sorgu_sorular, (quiz_id,))
@@ -311,6 +317,8 @@ def add_questions(quiz_id):
         return render_template("add_questions.html", form=form, quiz_id=quiz_id, quiz_title=quiz_title, questions=questions)
 
     elif quiz_type == 'turnuva':
+        from forms import PollItemForm
+        from images import save_optimized_image
         form = PollItemForm()
         if request.method == "POST":
             item_name = request.form.get('item_name')
@@ -319,16 +327,16 @@ def add_questions(quiz_id):
             if not file or file.filename == '':
                 flash("Lütfen bir fotoğraf seçin.", "danger")
                 cursor.close()
-                return redirect(url_for("add_questions", quiz_id=quiz_id))
+                return redirect(url_for("main.add_questions", quiz_id=quiz_id))
             
             if not allowed_file(file.filename):
                 flash("Geçersiz dosya tipi.", "danger")
                 cursor.close()
-                return redirect(url_for("add_questions", quiz_id=quiz_id))
+                return redirect(url_for("main.add_questions", quiz_id=quiz_id))
 
             filename = secure_filename(file.filename)
             unique_filename = str(uuid.uuid4()) + "_" + filename
-            file_path = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
+            file_path = os.path.join(current_app.config['UPLOAD_FOLDER'], unique_filename)
             save_optimized_image(file, file_path)
             
             sorgu_ekle = "INSERT INTO questions (quiz_id, question_text, image_url) VALUES (%s, %s, %s)"
@@ -337,7 +345,7 @@ def add_questions(quiz_id):
             
             flash(f"Seçenek '{item_name}' başarıyla eklendi.", "success")
             cursor.close()
-            return redirect(url_for("add_questions", quiz_id=quiz_id))
+            return redirect(url_for("main.add_questions", quiz_id=quiz_id))
 
         sorgu_mevcut = "SELECT * FROM questions WHERE quiz_id = %s"
         cursor.execute(sorgu_mevcut, (quiz_id,))
@@ -345,11 +353,12 @@ def add_questions(quiz_id):
         cursor.close() 
         return render_template("add_poll_questions.html", form=form, quiz_id=quiz_id, quiz_title=quiz_title, items=items)
     
-    return redirect(url_for("index"))
+    return redirect(url_for("main.index"))
 
-@app.route("/add_results/<string:quiz_id>", methods=["GET", "POST"])
+@bp.route("/add_results/<string:quiz_id>", methods=["GET", "POST"])
 @login_required
 def add_results(quiz_id):
+    from images import check_image, save_optimized_image
     cursor = mysql.connection.cursor()
     cursor.execute("SELECT * FROM quiz_results WHERE quiz_id = %s", (quiz_id,))
     existing_results = cursor.fetchall()
@@ -357,18 +366,28 @@ def add_results(quiz_id):
 
     if request.method == "POST":
         keys = ['A', 'B', 'C', 'D']
+        yuklemeler = {}
+        for key in keys:
+            file = request.files.get(f'image_{key}')
+            if request.form.get(f'title_{key}') and file and file.filename != '' and allowed_file(file.filename):
+                yuklemeler[key] = file
+
+        # Biri sınırı aşarsa hiçbiri kaydedilmez, yarım kalan dosya kalmaz
+        for file in yuklemeler.values():
+            check_image(file)
+
         for key in keys:
             title = request.form.get(f'title_{key}')
             description = request.form.get(f'description_{key}')
-            file = request.files.get(f'image_{key}')
+            file = yuklemeler.get(key)
             
             if not title: continue
 
             image_filename = results_dict.get(key, {}).get('image_url', 'default_result.png')
-            if file and file.filename != '' and allowed_file(file.filename):
+            if file:
                 filename = secure_filename(file.filename)
                 unique_filename = str(uuid.uuid4()) + "_" + filename
-                save_path = os.path.join(app.config['UPLOAD_FOLDER_QUIZ_COVERS'], unique_filename)
+                save_path = os.path.join(current_app.config['UPLOAD_FOLDER_QUIZ_COVERS'], unique_filename)
                 save_optimized_image(file, save_path)
                 image_filename = unique_filename
 
@@ -381,22 +400,24 @@ def add_results(quiz_id):
         
         mysql.connection.commit()
         flash("Sonuçlar kaydedildi. Quiz yayına hazır.", "success")
-        return redirect(url_for('index'))
+        return redirect(url_for('main.index'))
 
     cursor.close()
     return render_template("add_results.html", quiz_id=quiz_id, results=results_dict)
 
-@app.route("/publish_quiz/<string:quiz_id>")
+@bp.route("/publish_quiz/<string:quiz_id>")
 @login_required 
 def publish_quiz(quiz_id):
     flash("Quiz'iniz başarıyla yayınlandı!", "success")
-    return redirect(url_for("index"))
+    return redirect(url_for("main.index"))
 
 # === PROFİL İŞLEMLERİ ===
 
-@app.route("/profil", methods=["GET", "POST"])
+@bp.route("/profil", methods=["GET", "POST"])
 @login_required
 def profil():
+    from forms import ProfileEditForm
+    from images import PROFIL_BOYUTU, save_optimized_image
     form = ProfileEditForm()
     user_id = session["user_id"] 
     cursor = mysql.connection.cursor()
@@ -406,23 +427,25 @@ def profil():
         if file and allowed_file(file.filename):
             cursor.execute("SELECT profile_pic_url FROM users WHERE id = %s", (user_id,))
             old_pic = cursor.fetchone()['profile_pic_url']
-            
-            if old_pic and old_pic != 'default.png':
-                old_path = os.path.join(app.config['UPLOAD_FOLDER_PROFILE'], old_pic)
-                if os.path.exists(old_path):
-                    try: os.remove(old_path)
-                    except: pass
 
             filename = secure_filename(file.filename)
             unique_filename = str(uuid.uuid4()) + "_" + filename
-            save_path = os.path.join(app.config['UPLOAD_FOLDER_PROFILE'], unique_filename)
-            save_optimized_image(file, save_path, max_size=(400, 400))
+            save_path = os.path.join(current_app.config['UPLOAD_FOLDER_PROFILE'], unique_filename)
+            save_optimized_image(file, save_path, target_size=PROFIL_BOYUTU)
             
             cursor.execute("UPDATE users SET profile_pic_url = %s WHERE id = %s", (unique_filename, user_id))
             mysql.connection.commit()
             session["profile_pic_url"] = unique_filename
+
+            # Eski resim ancak yenisi kaydedilip veritabanına yazıldıktan sonra silinir;
+            # ImageTooLarge vb. bir hatada kullanıcının mevcut resmi yerinde kalır
+            if old_pic and old_pic != 'default.png':
+                old_path = os.path.join(current_app.config['UPLOAD_FOLDER_PROFILE'], old_pic)
+                if os.path.exists(old_path):
+                    try: os.remove(old_path)
+                    except: pass
             flash("Profil fotoğrafınız güncellendi!", "success")
-            return redirect(url_for("profil"))
+            return redirect(url_for("main.profil"))
 
     cursor.execute("SELECT * FROM users WHERE id = %s", (user_id,))
     user_data = cursor.fetchone()
@@ -436,7 +459,7 @@ def profil():
     cursor.close()
     return render_template("profil.html", form=form, user_data=user_data, created_count=created_count, liked_count=liked_count)
 
-@app.route("/paylastiklarim")
+@bp.route("/paylastiklarim")
 @login_required
 def paylastiklarim():
     user_id = session["user_id"]
@@ -447,7 +470,7 @@ def paylastiklarim():
     cursor.close()
     return render_template("paylastiklarim.html", quizzes=quizzes)
 
-@app.route("/kaydettiklerim")
+@bp.route("/kaydettiklerim")
 @login_required
 def kaydettiklerim():
     user_id = session["user_id"]
@@ -465,7 +488,7 @@ def kaydettiklerim():
     cursor.close()
     return render_template("kaydettiklerim.html", quizzes=quizzes)
 
-@app.route("/bilgiler", methods=["GET", "POST"])
+@bp.route("/bilgiler", methods=["GET", "POST"])
 @login_required
 def bilgiler():
     user_id = session["user_id"]
@@ -482,7 +505,7 @@ def bilgiler():
         
         session["username"] = username
         flash("Bilgileriniz başarıyla güncellendi.", "success")
-        return redirect(url_for("bilgiler"))
+        return redirect(url_for("main.bilgiler"))
 
     cursor.execute("SELECT * FROM users WHERE id = %s", (user_id,))
     user = cursor.fetchone()
@@ -491,29 +514,31 @@ def bilgiler():
 
 # === QUIZ OYNAMA MANTIĞI ===
 
-@app.route("/quiz/<string:quiz_id>", methods=["GET", "POST"])
+@bp.route("/quiz/<string:quiz_id>", methods=["GET", "POST"])
 def quiz_view(quiz_id):
+    # ASGI tarafı klasik testin GET'ini önceden okudu ve görüntülenmeyi artırdı
+    if "prefetched" in g:
+        return render_template("quiz_view.html", **g.pop("prefetched"))
+
     cursor = mysql.connection.cursor()
-    sorgu_quiz = "SELECT * FROM quizzes WHERE quiz_id = %s"
-    result_quiz = cursor.execute(sorgu_quiz, (quiz_id,))
+    result_quiz = cursor.execute(queries.QUIZ_SQL, (quiz_id,))
     
     if result_quiz == 0:
         flash("Böyle bir quiz bulunamadı.", "danger")
         cursor.close()
-        return redirect(url_for("index"))
+        return redirect(url_for("main.index"))
         
     quiz_data = cursor.fetchone()
     quiz_type = quiz_data["quiz_type"]
 
     # --- KLASİK TEST ---
     if quiz_type == 'klasik_test':
-        sorgu_questions = "SELECT * FROM questions WHERE quiz_id = %s"
-        cursor.execute(sorgu_questions, (quiz_id,))
+        cursor.execute(queries.QUESTIONS_SQL, (quiz_id,))
         questions_data = cursor.fetchall()
         
         if request.method == "GET":
             try:
-                cursor.execute("UPDATE quizzes SET views = views + 1 WHERE quiz_id = %s", (quiz_id,))
+                cursor.execute(queries.VIEWS_SQL, (quiz_id,))
                 mysql.connection.commit()
             except: pass
             cursor.close()
@@ -528,7 +553,7 @@ def quiz_view(quiz_id):
             if not user_choices:
                 flash("Lütfen soruları cevaplayın.", "danger")
                 cursor.close()
-                return redirect(url_for('quiz_view', quiz_id=quiz_id))
+                return redirect(url_for('main.quiz_view', quiz_id=quiz_id))
 
             from collections import Counter
             counts = Counter(user_choices)
@@ -572,7 +597,7 @@ def quiz_view(quiz_id):
             session['tournament_list'] = current_list
             session.modified = True
             cursor.close()
-            return redirect(url_for("quiz_view", quiz_id=quiz_id))
+            return redirect(url_for("main.quiz_view", quiz_id=quiz_id))
 
         if 'tournament_list' not in session or not session.get('tournament_list'):
             if 'winners_list' in session and len(session.get('winners_list')) > 1:
@@ -604,7 +629,7 @@ def quiz_view(quiz_id):
                 if len(questions_data) < 2:
                     flash("Yetersiz seçenek. Turnuva için en az 2 resim lazım.", "danger")
                     cursor.close()
-                    return redirect(url_for("index"))
+                    return redirect(url_for("main.index"))
                     
                 random.shuffle(questions_data)
                 session['tournament_list'] = questions_data
@@ -621,11 +646,11 @@ def quiz_view(quiz_id):
              session['tournament_list'] = []
              session.modified = True
              cursor.close()
-             return redirect(url_for("quiz_view", quiz_id=quiz_id))
+             return redirect(url_for("main.quiz_view", quiz_id=quiz_id))
         
         if len(current_list) == 0:
             cursor.close()
-            return redirect(url_for("quiz_view", quiz_id=quiz_id))
+            return redirect(url_for("main.quiz_view", quiz_id=quiz_id))
 
         item1 = current_list[0]
         item2 = current_list[1]
@@ -636,9 +661,9 @@ def quiz_view(quiz_id):
     else:
         flash("Bilinmeyen quiz tipi.", "danger")
         cursor.close()
-        return redirect(url_for("index"))
+        return redirect(url_for("main.index"))
 
-@app.route("/like_quiz/<string:quiz_id>")
+@bp.route("/like_quiz/<string:quiz_id>")
 @login_required 
 def like_quiz(quiz_id):
     user_id = session["user_id"]
@@ -653,60 +678,32 @@ def like_quiz(quiz_id):
         flash("Bu quiz'i zaten beğenmiştin.", "danger")
     finally:
         cursor.close()
-    return redirect(request.referrer or url_for("index"))
+    return redirect(request.referrer or url_for("main.index"))
 
-@app.route("/quiz_clear_session/<string:quiz_id>")
+@bp.route("/quiz_clear_session/<string:quiz_id>")
 def quiz_clear_session(quiz_id):
     session.pop('tournament_list', None)
     session.pop('winners_list', None)
     session.pop('tournament_round', None)
     session.modified = True
     flash("Turnuva oturumu sıfırlandı.", "success")
-    return redirect(url_for("quiz_view", quiz_id=quiz_id))
+    return redirect(url_for("main.quiz_view", quiz_id=quiz_id))
 
-@app.route("/leaderboard")
+@bp.route("/leaderboard")
 def leaderboard():
-    cursor = mysql.connection.cursor()
-    sorgu = """
-        SELECT users.id, users.username, users.name, users.profile_pic_url,
-            COALESCE(SUM(quizzes.views), 0) as total_views,
-            COALESCE(SUM(quizzes.likes), 0) as total_likes
-        FROM users LEFT JOIN quizzes ON users.id = quizzes.user_id
-        GROUP BY users.id ORDER BY total_views DESC LIMIT 20
-    """
-    cursor.execute(sorgu)
-    users = cursor.fetchall()
-    cursor.close()
-    return render_template("leaderboard.html", users=users)
+    return render_template("leaderboard.html", **oku(queries.leaderboard_data))
 
-@app.route("/quiz_detail/<string:quiz_id>")
+@bp.route("/quiz_detail/<string:quiz_id>")
 def quiz_detail(quiz_id):
-    cursor = mysql.connection.cursor()
-    sorgu = "SELECT q.*, u.username, u.profile_pic_url FROM quizzes q JOIN users u ON q.user_id = u.id WHERE q.quiz_id = %s"
-    cursor.execute(sorgu, (quiz_id,))
-    quiz = cursor.fetchone()
+    data = oku(queries.quiz_detail_data, quiz_id, session.get("user_id"), related_index.get(quiz_id))
     
-    if not quiz:
+    if not data["quiz"]:
         flash("Quiz bulunamadı.", "danger")
-        return redirect(url_for('index'))
-
-    cursor.execute("SELECT COUNT(*) as count FROM questions WHERE quiz_id = %s", (quiz_id,))
-    question_count = cursor.fetchone()['count']
-    
-    is_liked = False
-    is_saved = False
-    
-    if "user_id" in session:
-        user_id = session["user_id"]
-        cursor.execute("SELECT * FROM quiz_likes WHERE user_id=%s AND quiz_id=%s", (user_id, quiz_id))
-        if cursor.fetchone(): is_liked = True
-        cursor.execute("SELECT * FROM quiz_saves WHERE user_id=%s AND quiz_id=%s", (user_id, quiz_id))
-        if cursor.fetchone(): is_saved = True
+        return redirect(url_for('main.index'))
 
-    cursor.close()
-    return render_template("quiz_detail.html", quiz=quiz, q_count=question_count, is_liked=is_liked, is_saved=is_saved)
+    return render_template("quiz_detail.html", **data)
 
-@app.route("/save_quiz/<string:quiz_id>")
+@bp.route("/save_quiz/<string:quiz_id>")
 @login_required
 def save_quiz(quiz_id):
     cursor = mysql.connection.cursor()
@@ -720,9 +717,9 @@ def save_quiz(quiz_id):
         mysql.connection.commit()
         flash("Quiz kaydedilenlerden çıkarıldı.", "warning")
     cursor.close()
-    return redirect(url_for('quiz_detail', quiz_id=quiz_id))
+    return redirect(url_for('main.quiz_detail', quiz_id=quiz_id))
 
-@app.route("/user/<username>")
+@bp.route("/user/<username>")
 def user_profile(username):
     cursor = mysql.connection.cursor()
     sorgu_user = """
@@ -736,7 +733,7 @@ def user_profile(username):
     
     if not user:
         flash("Böyle bir kullanıcı bulunamadı.", "danger")
-        return redirect(url_for('index'))
+        return redirect(url_for('main.index'))
 
     cursor.execute("SELECT * FROM quizzes WHERE user_id = %s ORDER BY created_at DESC", (user['id'],))
     quizzes = cursor.fetchall()
@@ -745,7 +742,7 @@ def user_profile(username):
 
 # === ADMIN PANEL ===
 
-@app.route("/admin")
+@bp.route("/admin")
 @admin_required
 def admin_panel():
     cursor = mysql.connection.cursor()
@@ -766,9 +763,9 @@ def admin_panel():
     users = cursor.fetchall()
     
     cursor.close()
-    return render_template("admin.html", user_count=user_count, quiz_count=quiz_count, question_count=question_count, latest_quizzes=latest_quizzes, users=users)
+    return render_template("admin.html", user_count=user_count, quiz_count=quiz_count, question_count=question_count, latest_quizzes=latest_quizzes, users=users, card_cache_stats=current_app.extensions["card_cache"].stats(), startup_timings=current_app.config["STARTUP_TIMINGS"])
 
-@app.route("/admin/delete_quiz/<string:quiz_id>")
+@bp.route("/admin/delete_quiz/<string:quiz_id>")
 @admin_required
 def delete_quiz_admin(quiz_id):
     cursor = mysql.connection.cursor()
@@ -776,31 +773,38 @@ def delete_quiz_admin(quiz_id):
     mysql.connection.commit()
     cursor.close()
     flash("Quiz silindi (Admin).", "success")
-    return redirect(url_for("admin_panel"))
+    return redirect(url_for("main.admin_panel"))
 
-@app.route("/admin/delete_user/<string:user_id>")
+@bp.route("/admin/delete_user/<string:user_id>")
 @admin_required
 def delete_user_admin(user_id):
     if int(user_id) == int(session["user_id"]):
         flash("Kendini silemezsin!", "danger")
-        return redirect(url_for("admin_panel"))
+        return redirect(url_for("main.admin_panel"))
     cursor = mysql.connection.cursor()
     cursor.execute("DELETE FROM users WHERE id = %s", (user_id,))
     mysql.connection.commit()
     cursor.close()
     flash("Kullanıcı silindi.", "warning")
-    return redirect(url_for("admin_panel"))
+    return redirect(url_for("main.admin_panel"))
 
 # === HATALAR VE BAŞLATMA ===
 
-@app.errorhandler(404)
+@bp.app_errorhandler(404)
 def page_not_found(e):
     return render_template('404.html'), 404
 
-@app.errorhandler(500)
+@bp.app_errorhandler(413)
+def image_too_large(e):
+    flash("Yüklediğin dosya çok büyük. Lütfen daha küçük bir resim seç.", "danger")
+    return redirect(request.referrer or url_for("main.index"))
+
+@bp.app_errorhandler(500)
 def internal_server_error(e):
     return render_template('500.html'), 500
 
+IMPORT_SURESI = time.perf_counter() - _IMPORT_BASLANGIC
+
 if __name__ == "__main__":
     is_debug = os.environ.get("FLASK_DEBUG", "True").lower() == "true"
-    app.run(debug=is_debug, port=5001)
\ No newline at end of file
+    create_app().run(debug=is_debug, port=5001)
\ No newline at end of file
@@ -0,0 +1,175 @@
+"""Benzer quiz önerileri.
+
+'flask --app quiz build-related' komutu quiz_likes ve quiz_saves tablolarından
+kullanıcı x quiz seyrek matrisini kurar, quiz x quiz birlikte görülme
+matrisinden kosinüs benzerliğini hesaplar (aynı kategori ve popülerlik küçük
+bir bonus verir) ve her quiz için en benzer K quizi tek bir .npy dosyasına
+yazar. Uygulama bu dosyayı memory map ile açar; istek sırasında veritabanında
+hiçbir toplama yapılmaz. Komutun cron ile periyodik çalıştırılması yeterli.
+
+numpy sadece index dosyası ilk açıldığında, scipy sadece komut çalışırken
+import edilir.
+"""
+import os
+import time
+
+import click
+from flask import current_app
+
+KOMSU_SAYISI = 8
+BEGENI_AGIRLIGI = 1.0
+KAYIT_AGIRLIGI = 1.5
+KATEGORI_BONUSU = 0.1
+POPULERLIK_BONUSU = 1e-3
+BLOK_HUCRE = 1 << 24  # blok başına en fazla ~16M skor hücresi
+YENIDEN_KONTROL_SN = 60
+
+
+def compute_related(quiz_ids, categories, users, quizzes, weights, k=KOMSU_SAYISI):
+    """Her quiz için en benzer k quizi bulur.
+
+    quiz_ids sıralı olmalı. Dönen (n, k+1) int64 dizisinin ilk kolonu quiz'in
+    kendi id'si, kalanlar benzerlik sırasına göre komşular (eksikler -1).
+    """
+    import numpy as np
+    from scipy import sparse
+
+    quiz_ids = np.asarray(quiz_ids, dtype=np.int64)
+    quizzes = np.asarray(quizzes, dtype=np.int64)
+    n = len(quiz_ids)
+    result = np.full((n, k + 1), -1, dtype=np.int64)
+    result[:, 0] = quiz_ids
+    kk = min(k, n - 1)
+    if kk <= 0:
+        return result
+
+    # Silinmiş quizlere ait etkileşimler atlanır
+    cols = np.searchsorted(quiz_ids, quizzes)
+    gecerli = cols < n
+    gecerli[gecerli] = quiz_ids[cols[gecerli]] == quizzes[gecerli]
+    _, rows = np.unique(np.asarray(users)[gecerli], return_inverse=True)
+    X = sparse.csr_matrix((np.asarray(weights, dtype=np.float32)[gecerli], (rows, cols[gecerli])),
+                          shape=(rows.max() + 1 if rows.size else 0, n))
+
+    # Kosinüs benzerliği: D^-1 (X^T X) D^-1
+    C = (X.T @ X).tocsr()
+    norm = np.sqrt(C.diagonal())
+    ters = np.divide(1.0, norm, out=np.zeros_like(norm), where=norm > 0)
+    S = (sparse.diags(ters) @ C @ sparse.diags(ters)).tocsr()
+
+    _, kategori = np.unique(np.asarray([c or "" for c in categories], dtype=object).astype(str),
+                            return_inverse=True)
+    populerlik = np.log1p(np.asarray(X.sum(axis=0)).ravel())
+    if populerlik.max() > 0:
+        populerlik = POPULERLIK_BONUSU * populerlik / populerlik.max()
+
+    blok = max(1, BLOK_HUCRE // n)
+    for bas in range(0, n, blok):
+        son = min(bas + blok, n)
+        skor = S[bas:son].toarray()
+        skor += KATEGORI_BONUSU * (kategori[bas:son, None] == kategori[None, :])
+        skor += populerlik[None, :]
+        skor[np.arange(son - bas), np.arange(bas, son)] = -np.inf
+
+        en_iyi = np.argpartition(-skor, kk - 1, axis=1)[:, :kk]
+        en_iyi_skor = np.take_along_axis(skor, en_iyi, axis=1)
+        sira = np.argsort(-en_iyi_skor, axis=1, kind="stable")
+        en_iyi = np.take_along_axis(en_iyi, sira, axis=1)
+        en_iyi_skor = np.take_along_axis(en_iyi_skor, sira, axis=1)
+        result[bas:son, 1:kk + 1] = np.where(en_iyi_skor > 0, quiz_ids[en_iyi], -1)
+    return result
+
+
+def build_index(cursor, path, k=KOMSU_SAYISI):
+    import numpy as np
+
+    cursor.execute("SELECT quiz_id, category FROM quizzes ORDER BY quiz_id")
+    quiz_rows = cursor.fetchall()
+    cursor.execute("SELECT user_id, quiz_id FROM quiz_likes")
+    likes = cursor.fetchall()
+    cursor.execute("SELECT user_id, quiz_id FROM quiz_saves")
+    saves = cursor.fetchall()
+
+    etkilesimler = [(r["user_id"], r["quiz_id"], BEGENI_AGIRLIGI) for r in likes] + \
+                   [(r["user_id"], r["quiz_id"], KAYIT_AGIRLIGI) for r in saves]
+    users, quizzes, weights = zip(*etkilesimler) if etkilesimler else ((), (), ())
+    index = compute_related([r["quiz_id"] for r in quiz_rows], [r["category"] for r in quiz_rows],
+                            users, quizzes, weights, k=k)
+
+    # Önce geçici dosyaya yazılır, çalışan worker'lar yarım dosya görmez
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    gecici = path + ".tmp.npy"
+    np.save(gecici, index)
+    os.replace(gecici, path)
+    return index
+
+
+class _IndexDosyasi:
+    """Tek bir uygulamanın index dosyası; memory map ile açılır, değişince yeniden yüklenir."""
+
+    def __init__(self, path):
+        self.path = path
+        self._index = None
+        self._mtime = None
+        self._son_kontrol = None
+
+    def yukle(self):
+        simdi = time.monotonic()
+        if self._son_kontrol is not None and simdi - self._son_kontrol < YENIDEN_KONTROL_SN:
+            return self._index
+        self._son_kontrol = simdi
+
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            self._index, self._mtime = None, None
+            return None
+        if mtime != self._mtime:
+            try:
+                import numpy as np
+            except ImportError:
+                return None
+            self._index, self._mtime = np.load(self.path, mmap_mode="r"), mtime
+        return self._index
+
+
+class RelatedIndex:
+    """build-related çıktısını okur; dosya durumu uygulama başına app.extensions içinde tutulur."""
+
+    def __init__(self, db, app=None):
+        self.db = db
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("RELATED_INDEX_PATH", os.path.join(app.instance_path, "related_quizzes.npy"))
+        path = app.config["RELATED_INDEX_PATH"]
+        app.extensions["related_index"] = _IndexDosyasi(path)
+
+        @app.cli.command("build-related")
+        @click.option("--k", default=KOMSU_SAYISI, show_default=True, help="Quiz başına komşu sayısı.")
+        def build_related_command(k):
+            """Beğeni ve kayıtlardan benzer quiz index'ini üretir."""
+            basla = time.perf_counter()
+            cursor = self.db.connection.cursor()
+            try:
+                index = build_index(cursor, path, k=k)
+            finally:
+                cursor.close()
+            click.echo(f"{len(index)} quiz, {time.perf_counter() - basla:.2f} sn: {path}")
+
+    def get(self, quiz_id):
+        """Quiz'e en benzer quizlerin id'lerini döndürür; index yoksa boş liste."""
+        index = current_app.extensions["related_index"].yukle()
+        if index is None or len(index) == 0:
+            return []
+        try:
+            quiz_id = int(quiz_id)
+        except (TypeError, ValueError):
+            return []
+
+        ids = index[:, 0]
+        i = int(ids.searchsorted(quiz_id))
+        if i >= len(ids) or ids[i] != quiz_id:
+            return []
+        return [int(x) for x in index[i, 1:] if x >= 0]
@@ -0,0 +1,199 @@
+import json
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+import click
+
+from image_sizes import PROFIL_BOYUTU, VARSAYILAN_BOYUT
+from static_assets import PARMAK_IZI, UUID_ONEK
+
+# Klasör -> (hedef boyut, dosya adını tutan veritabanı kolonları).
+# images PIL'i yüklediği için sadece alt süreçlerde import edilir.
+UPLOAD_KLASORLERI = {
+    "UPLOAD_FOLDER": (VARSAYILAN_BOYUT, [("questions", "image_url")]),
+    "UPLOAD_FOLDER_QUIZ_COVERS": (VARSAYILAN_BOYUT, [("quizzes", "cover_image_url"),
+                                                      ("quiz_results", "image_url")]),
+    "UPLOAD_FOLDER_PROFILE": (PROFIL_BOYUTU, [("users", "profile_pic_url")]),
+}
+
+
+def _yeni_ad(ad):
+    """Yükleme sırasındaki adlandırmayla aynı: uuid öneki + orijinal ad, .jpg uzantılı."""
+    kok = os.path.splitext(UUID_ONEK.sub("", ad))[0]
+    return f"{uuid.uuid4()}_{kok}.jpg"
+
+
+def _yeniden_kodla(is_):
+    """Alt süreçte çalışır: tek bir dosyayı güncel formata çevirip yeni adla yazar."""
+    from PIL import Image
+    from images import open_image, optimize_image, save_image
+
+    klasor, ad, hedef_boyut = is_
+    kaynak = os.path.join(klasor, ad)
+    sonuc = {"klasor": klasor, "ad": ad}
+
+    try:
+        sonuc["eski_boyut"] = os.path.getsize(kaynak)
+        with Image.open(kaynak) as img:
+            if img.format == "JPEG" and img.size == tuple(hedef_boyut):
+                sonuc["durum"] = "guncel"
+                return sonuc
+
+        with open_image(kaynak, hedef_boyut) as img:
+            yeni = optimize_image(img, hedef_boyut)
+
+        yeni_ad = _yeni_ad(ad)
+        gecici = os.path.join(klasor, f".{yeni_ad}.tmp")
+        save_image(yeni, gecici)
+        yeni_boyut = os.path.getsize(gecici)
+
+        # Küçük PNG'ler gibi JPEG'e çevrilince büyüyen dosyalar olduğu gibi bırakılır
+        if yeni_boyut >= sonuc["eski_boyut"]:
+            os.remove(gecici)
+            sonuc["durum"] = "buyuyor"
+            return sonuc
+        os.replace(gecici, os.path.join(klasor, yeni_ad))
+    except Exception as e:
+        sonuc.update(durum="hata", hata=str(e))
+        return sonuc
+
+    sonuc.update(durum="kodlandi", yeni_ad=yeni_ad, yeni_boyut=yeni_boyut)
+    return sonuc
+
+
+def _gunluk_kayitlari(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(satir) for satir in f if satir.strip()]
+
+
+def _gunluk_oku(path):
+    return {(kayit["klasor"], kayit["ad"]) for kayit in _gunluk_kayitlari(path)}
+
+
+def _isleri_topla(app, bitenler):
+    isler = []
+    for config_key, (hedef_boyut, _) in UPLOAD_KLASORLERI.items():
+        klasor = app.config[config_key]
+        if not os.path.isdir(klasor):
+            continue
+        for ad in sorted(os.listdir(klasor)):
+            # default.* dosyaları kod içinde adıyla kullanılıyor, build-assets'in parmak
+            # izli kopyaları da manifest üzerinden; ikisine de dokunulmaz
+            if ad.startswith((".", "default")) or PARMAK_IZI.search(ad) or (klasor, ad) in bitenler:
+                continue
+            if os.path.isfile(os.path.join(klasor, ad)):
+                isler.append((klasor, ad, hedef_boyut))
+    return isler
+
+
+def _veritabanini_guncelle(mysql, kolonlar, eski_ad, yeni_ad):
+    """Dosyayı gösteren tüm kolonları tek transaction içinde yeni ada çevirir."""
+    cursor = mysql.connection.cursor()
+    try:
+        for tablo, kolon in kolonlar:
+            cursor.execute(f"UPDATE {tablo} SET {kolon} = %s WHERE {kolon} = %s", (yeni_ad, eski_ad))
+        mysql.connection.commit()
+    except Exception:
+        mysql.connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def reencode_uploads(app, mysql, journal_path, jobs=None):
+    bitenler = _gunluk_oku(journal_path)
+    isler = _isleri_topla(app, bitenler)
+    kolonlar = {app.config[key]: cols for key, (_, cols) in UPLOAD_KLASORLERI.items()}
+
+    ozet = {"kodlandi": 0, "guncel": 0, "buyuyor": 0, "hata": 0, "kazanilan": 0}
+    click.echo(f"{len(isler)} dosya işlenecek ({len(bitenler)} dosya önceki çalışmalarda bitmiş).")
+
+    with open(journal_path, "a", encoding="utf-8") as gunluk, \
+            ProcessPoolExecutor(max_workers=jobs) as havuz:
+        for sonuc in havuz.map(_yeniden_kodla, isler, chunksize=4):
+            if sonuc["durum"] == "kodlandi":
+                try:
+                    _veritabanini_guncelle(mysql, kolonlar[sonuc["klasor"]], sonuc["ad"], sonuc["yeni_ad"])
+                except Exception as e:
+                    os.remove(os.path.join(sonuc["klasor"], sonuc["yeni_ad"]))
+                    sonuc.update(durum="hata", hata=f"veritabanı: {e}")
+                else:
+                    # Eski dosya silinmez: session'daki profil resmi ve turnuva
+                    # listeleri hâlâ eski adı gösteriyor olabilir (bkz. --prune)
+                    ozet["kazanilan"] += sonuc["eski_boyut"] - sonuc["yeni_boyut"]
+
+            ozet[sonuc["durum"]] += 1
+            if sonuc["durum"] == "hata":
+                click.echo(f"HATA {sonuc['ad']}: {sonuc['hata']}", err=True)
+            else:
+                # Hatalı dosyalar günlüğe yazılmaz, sonraki çalışmada tekrar denenir
+                gunluk.write(json.dumps(sonuc, ensure_ascii=False) + "\n")
+                gunluk.flush()
+                os.fsync(gunluk.fileno())
+
+    click.echo(f"Kodlanan: {ozet['kodlandi']}, zaten güncel: {ozet['guncel']}, "
+               f"büyüyeceği için atlanan: {ozet['buyuyor']}, hata: {ozet['hata']}")
+    click.echo(f"Kazanılacak alan: {ozet['kazanilan'] / 1024:.1f} KB (eski dosyalar --prune ile silinince)")
+    return ozet
+
+
+def _hala_kullaniliyor(mysql, kolonlar, ad):
+    cursor = mysql.connection.cursor()
+    try:
+        for tablo, kolon in kolonlar:
+            if cursor.execute(f"SELECT 1 FROM {tablo} WHERE {kolon} = %s LIMIT 1", (ad,)):
+                return True
+        return False
+    finally:
+        cursor.close()
+
+
+def prune_uploads(app, mysql, journal_path):
+    """Yeniden kodlanmış dosyaların orijinallerini siler.
+
+    Oturumlar eski adları taşıyabildiği için ancak yeniden kodlamadan önce
+    açılmış oturumların süresi dolduktan sonra çalıştırılmalı.
+    """
+    kolonlar = {app.config[key]: cols for key, (_, cols) in UPLOAD_KLASORLERI.items()}
+    silinen, bosalan = 0, 0
+
+    for kayit in _gunluk_kayitlari(journal_path):
+        # Eski sürümlerin günlüğe yazdığı parmak izli kopyalar da silinmez
+        if kayit["durum"] != "kodlandi" or PARMAK_IZI.search(kayit["ad"]):
+            continue
+        eski_yol = os.path.join(kayit["klasor"], kayit["ad"])
+        if not os.path.exists(eski_yol):
+            continue
+        if _hala_kullaniliyor(mysql, kolonlar.get(kayit["klasor"], []), kayit["ad"]):
+            click.echo(f"ATLANDI {kayit['ad']}: veritabanında hâlâ kullanılıyor", err=True)
+            continue
+        try:
+            boyut = os.path.getsize(eski_yol)
+            os.remove(eski_yol)
+        except OSError as e:
+            click.echo(f"HATA {kayit['ad']}: {e}", err=True)
+            continue
+        silinen += 1
+        bosalan += boyut
+
+    click.echo(f"Silinen eski dosya: {silinen}, boşalan alan: {bosalan / 1024:.1f} KB")
+    return silinen, bosalan
+
+
+def register_commands(app, mysql):
+    @app.cli.command("reencode-uploads")
+    @click.option("--jobs", type=int, default=None, help="Süreç sayısı (varsayılan: tüm çekirdekler).")
+    @click.option("--journal", default=None, help="İlerleme günlüğü (varsayılan: reencode_journal.jsonl).")
+    @click.option("--prune", is_flag=True,
+                  help="Kodlama yapmaz; daha önce kodlanmış dosyaların orijinallerini siler. "
+                       "Eski oturumların süresi dolduktan sonra çalıştırın.")
+    def reencode_uploads_command(jobs, journal, prune):
+        """Eski yüklemeleri güncel resim formatına çevirir ve veritabanını günceller."""
+        journal = journal or os.path.join(app.root_path, "reencode_journal.jsonl")
+        if prune:
+            prune_uploads(app, mysql, journal)
+        else:
+            reencode_uploads(app, mysql, journal, jobs=jobs)
@@ -0,0 +1,40 @@
+"""Üretim sunucusu başlatıcısı (gunicorn).
+
+    python serve.py          WSGI: gthread worker'ları ile quiz:create_app()
+    python serve.py --asgi   ASGI: uvicorn worker'ları ile asgi:application
+
+Ortam değişkenleri:
+    WEB_WORKERS   süreç sayısı (varsayılan: 2 x çekirdek + 1)
+    WEB_THREADS   süreç başına thread; ASGI'de WSGI'ye düşen istekler için (varsayılan: 8)
+    PORT          dinlenecek port (varsayılan: 5001)
+"""
+import argparse
+import os
+
+
+def gunicorn_args(asgi=False):
+    workers = int(os.environ.get("WEB_WORKERS", 2 * (os.cpu_count() or 1) + 1))
+    threads = int(os.environ.get("WEB_THREADS", 8))
+    bind = f"0.0.0.0:{os.environ.get('PORT', 5001)}"
+
+    args = ["gunicorn", "--workers", str(workers), "--bind", bind,
+            "--timeout", "30", "--keep-alive", "5"]
+    if asgi:
+        args += ["--worker-class", "uvicorn.workers.UvicornWorker", "asgi:application"]
+    else:
+        args += ["--worker-class", "gthread", "--threads", str(threads), "quiz:create_app()"]
+    return args
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SorSana üretim sunucusu")
+    parser.add_argument("--asgi", action="store_true", help="uvicorn worker'ları ile ASGI olarak çalıştır")
+    args = gunicorn_args(asgi=parser.parse_args().asgi)
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    print(" ".join(args))
+    os.execvp(args[0], args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import shutil
+
+import click
+from flask import abort, current_app, request, send_from_directory
+from werkzeug.utils import safe_join
+
+try:
+    import brotli
+except ImportError:  # brotli kurulu değilse sadece gzip üretilir
+    brotli = None
+
+MANIFEST_ADI = "manifest.json"
+METIN_UZANTILARI = {".css", ".js", ".svg", ".html", ".json", ".txt"}
+SIKISTIRMALAR = (("br", ".br"), ("gzip", ".gz"))
+BIR_YIL = 365 * 24 * 60 * 60
+
+# Yüklenen dosyalar uuid önekiyle kaydedildiği için içerikleri hiç değişmez
+UUID_ONEK = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}_")
+
+# build-assets'in ürettiği kopyalar: ad.<12 haneli özet>.uzantı
+PARMAK_IZI = re.compile(r"\.[0-9a-f]{12}(\.[^.]+)?$")
+
+
+def _dosya_ozeti(path):
+    ozet = hashlib.sha256()
+    with open(path, "rb") as f:
+        for parca in iter(lambda: f.read(64 * 1024), b""):
+            ozet.update(parca)
+    return ozet.hexdigest()[:12]
+
+
+def parmak_izli_ad(relpath, ozet):
+    kok, uzanti = os.path.splitext(relpath)
+    return f"{kok}.{ozet}{uzanti}"
+
+
+def _on_sikistir(path):
+    """Metin dosyasının .gz (ve varsa .br) kopyasını yanına yazar."""
+    with open(path, "rb") as f:
+        veri = f.read()
+
+    kopyalar = {".gz": gzip.compress(veri, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        kopyalar[".br"] = brotli.compress(veri, quality=11)
+
+    for uzanti, sikismis in kopyalar.items():
+        # Küçülmeyen dosyanın sıkıştırılmış kopyasını tutmanın anlamı yok
+        if len(sikismis) < len(veri):
+            with open(path + uzanti, "wb") as f:
+                f.write(sikismis)
+
+
+def _parmak_izli_kopya(path, hedef):
+    """Dosyanın parmak izli kopyasını yazar; aynı özetli kopya varsa dokunmaz."""
+    if os.path.exists(hedef):
+        return
+    gecici = hedef + ".tmp"
+    shutil.copyfile(path, gecici)
+    os.replace(gecici, hedef)
+
+
+def build_manifest(static_root):
+    """static/ altındaki dosyaların parmak izli kopyalarını yazar, metinleri ön sıkıştırır.
+
+    Kopyalar içerikleri hiç değişmeyeceği için bir yıl önbelleklenebilir;
+    eski kopyalar silinmez, önbellekteki eski sayfalar onları istemeye devam edebilir.
+    """
+    manifest = {}
+    for dirpath, _, filenames in os.walk(static_root):
+        for name in filenames:
+            if name == MANIFEST_ADI or name.endswith((".gz", ".br", ".tmp")):
+                continue
+            # Önceki çalışmaların kopyaları ve uuid önekli yüklemeler zaten değişmez
+            if PARMAK_IZI.search(name) or UUID_ONEK.match(name):
+                continue
+            path = os.path.join(dirpath, name)
+            rel = os.path.relpath(path, static_root).replace(os.sep, "/")
+            manifest[rel] = parmak_izli_ad(rel, _dosya_ozeti(path))
+
+            kopya = os.path.join(static_root, manifest[rel])
+            _parmak_izli_kopya(path, kopya)
+            if os.path.splitext(name)[1].lower() in METIN_UZANTILARI:
+                _on_sikistir(kopya)
+
+    with open(os.path.join(static_root, MANIFEST_ADI), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    return manifest
+
+
+class StaticAssets:
+    """Flask'ın static handler'ını parmak izli ve önbellek dostu sürümüyle değiştirir.
+
+    Manifest uygulama başına app.extensions["static_assets"] içinde tutulur.
+    """
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.load_manifest(app)
+
+        app.url_defaults(self._url_defaults)
+        app.view_functions["static"] = self.serve
+
+        @app.cli.command("build-assets")
+        def build_assets_command():
+            """Statik dosyalar için manifest ve sıkıştırılmış kopyaları üretir."""
+            manifest = build_manifest(app.static_folder)
+            click.echo(f"{len(manifest)} dosya işlendi: {os.path.join(app.static_folder, MANIFEST_ADI)}")
+
+    def load_manifest(self, app):
+        path = os.path.join(app.static_folder, MANIFEST_ADI)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        else:
+            manifest = {}
+        app.extensions["static_assets"] = {
+            "static_root": app.static_folder,
+            "manifest": manifest,
+        }
+
+    def _url_defaults(self, endpoint, values):
+        manifest = current_app.extensions["static_assets"]["manifest"]
+        if endpoint == "static" and values.get("filename") in manifest:
+            values["filename"] = manifest[values["filename"]]
+
+    def serve(self, filename):
+        # Sıkıştırılmış kopyalar sadece Accept-Encoding ile seçilir, doğrudan sunulmaz
+        if filename.endswith((".gz", ".br")):
+            abort(404)
+
+        static_root = current_app.extensions["static_assets"]["static_root"]
+        # Parmak izli adlar diskteki kopyalarından sunulur, orijinal dosya sonradan
+        # değişse bile aynı ad hep aynı içeriği döndürür; önceki build'lerin
+        # kopyaları da buna dahil
+        ad = os.path.basename(filename)
+        degismez = bool(PARMAK_IZI.search(ad) or UUID_ONEK.match(ad))
+
+        kaynak = safe_join(static_root, filename)
+        gonderilecek, kodlama = filename, None
+        # Range istekleri sıkıştırılmamış dosyanın baytlarına göre hesaplanır
+        if "Range" not in request.headers and kaynak and os.path.isfile(kaynak):
+            for ad, uzanti in SIKISTIRMALAR:
+                aday = kaynak + uzanti
+                if request.accept_encodings[ad] and _guncel_mi(aday, kaynak):
+                    gonderilecek, kodlama = filename + uzanti, ad
+                    break
+
+        kwargs = {"max_age": BIR_YIL} if degismez else {}
+        response = send_from_directory(static_root, gonderilecek,
+                                       mimetype=mimetypes.guess_type(filename)[0],
+                                       conditional=True, **kwargs)
+        if kodlama:
+            response.headers["Content-Encoding"] = kodlama
+        if os.path.splitext(filename)[1].lower() in METIN_UZANTILARI:
+            response.vary.add("Accept-Encoding")
+        if degismez:
+            response.headers["Cache-Control"] = f"public, max-age={BIR_YIL}, immutable"
+        return response
+
+
+def _guncel_mi(kopya, kaynak):
+    """Sıkıştırılmış kopya var ve kaynaktan eski değilse True."""
+    try:
+        return os.path.getmtime(kopya) >= os.path.getmtime(kaynak)
+    except OSError:
+        return False